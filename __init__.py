@@ -1,35 +1,65 @@
 """The Renogy Rover integration."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .config_flow import connect_and_read_device_info
-from .const import ATTR_DEVICE_ADDRESS, ATTR_SERIAL_NUMBER, DOMAIN
+from .const import ATTR_BAUDRATE, ATTR_DEVICE_ADDRESS, ATTR_SERIAL_NUMBER, DATA_LAST_PROBE, DEFAULT_BAUDRATE, DOMAIN
+from .coordinator import RenogyRoverFastCoordinator, RenogyRoverSlowCoordinator, port_lock
 from .renogy_rover import RenogyRover
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Renogy Rover component."""
+    hass.data[DOMAIN] = {DATA_LAST_PROBE: {}}
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Renogy Rover from a config entry."""
-    device_info = await hass.async_add_executor_job(
-        connect_and_read_device_info, hass, entry.data
-    )
-
-    # Validation check
-    if not device_matches_entry(device_info, entry):
-        _LOGGER.error(
-            'Device serial number "%s" does not match serial number "%s" in config entry!' % (device_info[ATTR_SERIAL_NUMBER], entry.data[ATTR_SERIAL_NUMBER])
+    last_probe = hass.data[DOMAIN][DATA_LAST_PROBE]
+    if last_probe.get(entry.entry_id) == entry.data[ATTR_SERIAL_NUMBER]:
+        # The device was already validated before this reload, so don't delay the setup with probing it again
+        entry.async_create_background_task(
+            hass, async_revalidate_device(hass, entry), f"{DOMAIN}_revalidate_{entry.entry_id}"
         )
-        return False
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = RenogyRover(entry.data[CONF_PORT], entry.data[ATTR_DEVICE_ADDRESS])
+    else:
+        device_info = await async_read_device_info(hass, entry)
+
+        # Validation check
+        if not device_matches_entry(device_info, entry):
+            _LOGGER.error(
+                'Device serial number "%s" does not match serial number "%s" in config entry!', device_info[ATTR_SERIAL_NUMBER], entry.data[ATTR_SERIAL_NUMBER]
+            )
+            return False
+        last_probe[entry.entry_id] = device_info[ATTR_SERIAL_NUMBER]
+
+    client = RenogyRover(
+        entry.data[CONF_PORT],
+        entry.data[ATTR_DEVICE_ADDRESS],
+        baudrate=entry.data.get(ATTR_BAUDRATE, DEFAULT_BAUDRATE),
+    )
+    coordinators = {
+        "fast": RenogyRoverFastCoordinator(hass, client),
+        "slow": RenogyRoverSlowCoordinator(hass, client),
+    }
+    for coordinator in coordinators.values():
+        await coordinator.async_config_entry_first_refresh()
+    hass.data[DOMAIN][entry.entry_id] = coordinators
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -44,6 +74,38 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_read_device_info(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, str]:
+    """Read the device info of the device configured in the entry."""
+    # Probe on a dedicated thread so a slow serial bus doesn't block the shared executor
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="renogy_scan")
+    try:
+        async with port_lock(entry.data[CONF_PORT]):
+            return await hass.loop.run_in_executor(
+                executor, partial(connect_and_read_device_info, hass, entry.data)
+            )
+    finally:
+        executor.shutdown(wait=False)
+
+
+async def async_revalidate_device(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Check that the device still matches the entry, and reload the entry if it doesn't."""
+    try:
+        device_info = await async_read_device_info(hass, entry)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.warning("Could not revalidate device at %s", entry.data[CONF_PORT])
+        return
+
+    if not device_matches_entry(device_info, entry):
+        _LOGGER.error(
+            'Device serial number "%s" does not match serial number "%s" in config entry!', device_info[ATTR_SERIAL_NUMBER], entry.data[ATTR_SERIAL_NUMBER]
+        )
+        # The reload then does the full validation and fails the setup
+        hass.data[DOMAIN][DATA_LAST_PROBE].pop(entry.entry_id, None)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 def device_matches_entry(
     device_info: dict[str, str], config_entry: ConfigEntry
 ) -> bool:
@@ -4,11 +4,11 @@ from __future__ import annotations
 from collections.abc import Mapping
 import logging
 import os
+import time
 from typing import Any
 
 from serial import SerialException
 import minimalmodbus
-import serial.tools.list_ports
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -17,11 +17,59 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import ATTR_DEVICE_ADDRESS, ATTR_SERIAL_NUMBER, DEFAULT_INTEGRATION_TITLE, DOMAIN, MAX_DEVICE_ADDRESS, MIN_DEVICE_ADDRESS
-from .renogy_rover import RenogyRover
+from .const import ATTR_BAUDRATE, ATTR_DEVICE_ADDRESS, ATTR_SERIAL_NUMBER, BAUDRATES, DEFAULT_BAUDRATE, DEFAULT_INTEGRATION_TITLE, DOMAIN, MAX_DEVICE_ADDRESS, MIN_DEVICE_ADDRESS
+from .coordinator import port_lock
+from .renogy_rover import SCAN_RESPONSE_BYTES, RenogyRover
 
 _LOGGER = logging.getLogger(__name__)
 
+# On Home Assistant OS there is a directory with symlinks derived from device ids
+SERIAL_ID_LINKS_DIR = "/dev/serial/by-id"
+# Seconds a COM port scan result is shared between config flows
+COMPORTS_CACHE_TTL = 30.0
+
+# Device addresses that are likely to be configured are scanned first
+_COMMON_ADDRESSES = (1, 16, 247, 32, 48, 64, 128)
+_SCAN_ORDER: tuple[int, ...] = _COMMON_ADDRESSES + tuple(
+    device_address
+    for device_address in range(MIN_DEVICE_ADDRESS, MAX_DEVICE_ADDRESS + 1)
+    if device_address not in _COMMON_ADDRESSES
+)
+
+# (monotonic timestamp, by-id directory mtime, scan result)
+_COMPORTS_CACHE: tuple[float, int | None, tuple[list[str] | None, str | None]] | None = None
+
+
+def _probe_uart(
+    com_port: str,
+    device_address: int,
+    baudrate: int = DEFAULT_BAUDRATE,
+    scan_timeout: float | None = None,
+) -> dict[str, str] | None:
+    """Read the device info of the device at the given address.
+
+    Returns None if no device answered at this address.
+    """
+    try:
+        client = RenogyRover(com_port, device_address, baudrate=baudrate, scan_timeout=scan_timeout)
+        if scan_timeout is not None:
+            # Check for an answer with a short request first, as most scanned addresses are silent
+            client.serial_number()
+            # The device answered, so read the device info with the regular timeout
+            client.restore_timeout()
+        device_info = {ATTR_DEVICE_ADDRESS: device_address}
+        (
+            device_info[ATTR_MODEL],
+            device_info[ATTR_SW_VERSION],
+            device_info[ATTR_HW_VERSION],
+            device_info[ATTR_SERIAL_NUMBER],
+        ) = client.device_info_block()
+    except minimalmodbus.NoResponseError:
+        _LOGGER.debug("Scanned address %s: no answer", device_address)
+        return None
+    _LOGGER.debug("Scanned address %s: connection established", device_address)
+    return device_info
+
 
 def connect_and_read_device_info(
     hass: HomeAssistant, data: Mapping[str, Any]
@@ -31,56 +79,94 @@ def connect_and_read_device_info(
     Data has the keys from DATA_SCHEMA with values provided by the user.
     """
     com_port = data[CONF_PORT]
+    # Entries created before the baud rate was configurable use the default
+    baudrate = data.get(ATTR_BAUDRATE, DEFAULT_BAUDRATE)
     _LOGGER.debug("Intitialising com port=%s", com_port)
-    device_info = {}
     # Either device address is already configured, or an address scan is performed if it is the first time connecting
-    min_device_address = data[ATTR_DEVICE_ADDRESS] if ATTR_DEVICE_ADDRESS in data else MIN_DEVICE_ADDRESS
-    max_device_address = data[ATTR_DEVICE_ADDRESS] if ATTR_DEVICE_ADDRESS in data else MAX_DEVICE_ADDRESS
-    for device_address in range(min_device_address, max_device_address+1):
+    if ATTR_DEVICE_ADDRESS in data:
+        device_addresses = (data[ATTR_DEVICE_ADDRESS],)
+        scan_timeout = None
+    else:
+        device_addresses = _SCAN_ORDER
+        # Silent addresses are the common case during a scan, so only wait for the short serial number response
+        scan_timeout = RenogyRover.response_timeout(baudrate, response_bytes=SCAN_RESPONSE_BYTES)
+    for device_address in device_addresses:
         try:
-            client = RenogyRover(com_port, device_address)
-            _LOGGER.debug(f"Scanned address {device_address}: connection established")
-            device_info[ATTR_DEVICE_ADDRESS] = device_address
-            device_info[ATTR_SERIAL_NUMBER] = client.serial_number()
-            device_info[ATTR_SW_VERSION], device_info[ATTR_HW_VERSION] = client.version()
-            device_info[ATTR_MODEL] = client.model()
-            _LOGGER.debug("Returning device info=%s", device_info)
-            break
+            device_info = _probe_uart(com_port, device_address, baudrate, scan_timeout)
         except SerialException as error:
             _LOGGER.exception("Cannot open serial port %s", com_port)
             if error.errno == 19:  # No such device.
                 raise InvalidPort from error
             else:
                 raise CannotOpenPort from error
-        except minimalmodbus.NoResponseError as error:
-            _LOGGER.debug(f"Scanned address {device_address}: no answer")
-            if device_address == max_device_address:
-                raise NoDeviceFound from error
-            else:
-                continue
-        except Exception as err:  # pylint: disable=broad-except
+        except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Could not connect to device=%s", com_port)
-            raise err
+            raise
+        if device_info is not None:
+            _LOGGER.debug("Returning device info=%s", device_info)
+            return device_info
 
-    return device_info
+    raise NoDeviceFound
+
+
+def _serial_id_links_mtime() -> int | None:
+    """Return the modification time of the by-id directory, None if it does not exist."""
+    try:
+        return os.stat(SERIAL_ID_LINKS_DIR).st_mtime_ns
+    except OSError:
+        return None
 
 
 def scan_comports() -> tuple[list[str] | None, str | None]:
+    """Find available COM ports, reusing the scan of a recent config flow if nothing was plugged in or out.
+
+    Runs blocking I/O, so call it in the executor.
+    """
+    global _COMPORTS_CACHE  # pylint: disable=global-statement
+
+    mtime = _serial_id_links_mtime()
+    if _COMPORTS_CACHE is not None:
+        timestamp, cached_mtime, result = _COMPORTS_CACHE
+        if cached_mtime == mtime and time.monotonic() - timestamp < COMPORTS_CACHE_TTL:
+            return result
+
+    result = _scan_comports()
+    # Scan again next time if no port was found, the adaptor may be plugged in by then
+    _COMPORTS_CACHE = (time.monotonic(), mtime, result) if result[1] is not None else None
+    return result
+
+
+def invalidate_comports_cache() -> None:
+    """Discard the cached COM port scan, e.g. after a listed port turned out to be gone."""
+    global _COMPORTS_CACHE  # pylint: disable=global-statement
+
+    _COMPORTS_CACHE = None
+
+
+def _scan_comports() -> tuple[list[str] | None, str | None]:
     """Find and store available COM ports for the GUI dropdown."""
-    com_ports = serial.tools.list_ports.comports(include_links=True)
-    com_ports_list = []
-    
-    # On Home Assistant OS there is a directory with symlinks derived from device ids,
-    # which should be used to have deterministic device selection after reboot (USB number can change!)
-    serial_id_links_dir = "/dev/serial/by-id"
-    if os.path.exists(serial_id_links_dir):
-        for device_link_name in os.listdir(serial_id_links_dir):
-            com_ports_list.append(os.path.join(serial_id_links_dir, device_link_name))
-            _LOGGER.debug("Found COM port: %s", device_link_name)
-    else:
-        for port in com_ports:
-            com_ports_list.append(port.device)
-            _LOGGER.debug("Found COM port: %s", port.device)
+    # Only needed when configuring, so don't load the port enumeration backends on startup
+    import serial.tools.list_ports  # pylint: disable=import-outside-toplevel
+
+    # Offer each device once, by real path
+    com_ports: dict[str, str] = {}
+
+    # The by-id symlinks should be used to have deterministic device selection after reboot (USB number can change!)
+    # They are added first, so they are listed first and one of them is the default.
+    try:
+        with os.scandir(SERIAL_ID_LINKS_DIR) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    com_ports.setdefault(os.path.realpath(entry.path), entry.path)
+    except FileNotFoundError:
+        pass
+
+    for port in serial.tools.list_ports.comports(include_links=True):
+        com_ports.setdefault(os.path.realpath(port.device), port.device)
+
+    com_ports_list = list(com_ports.values())
+    for com_port in com_ports_list:
+        _LOGGER.debug("Found COM port: %s", com_port)
 
     if len(com_ports_list) > 0:
         return com_ports_list, com_ports_list[0]
@@ -99,6 +185,8 @@ class RenogyRoverConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.init_info = None
         self._com_ports_list = None
         self._default_com_port = None
+        # Port selection schema, built on first display
+        self._port_schema_cached: vol.Schema | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -110,8 +198,9 @@ class RenogyRoverConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle the first step, which is selecting the serial port."""
         errors = {}
         if self._com_ports_list is None:
-            result = await self.hass.async_add_executor_job(scan_comports)
-            self._com_ports_list, self._default_com_port = result
+            self._com_ports_list, self._default_com_port = await self.hass.async_add_executor_job(
+                scan_comports
+            )
             if self._default_com_port is None:
                 return self.async_abort(reason="no_serial_ports")
 
@@ -119,11 +208,14 @@ class RenogyRoverConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Try to connect and read device info
             try:
-                self.init_info = await self.hass.async_add_executor_job(
-                    connect_and_read_device_info, self.hass, user_input
-                )
+                async with port_lock(user_input[CONF_PORT]):
+                    self.init_info = await self.hass.async_add_executor_job(
+                        connect_and_read_device_info, self.hass, user_input
+                    )
             except InvalidPort:
                 errors["base"] = "invalid_serial_port"
+                # The port list is outdated, so scan again for the next flow
+                invalidate_comports_cache()
             except CannotOpenPort:
                 errors["base"] = "cannot_open_serial_port"
                 _LOGGER.exception("Cannot open serial port %s", user_input[CONF_PORT])
@@ -138,24 +230,34 @@ class RenogyRoverConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 await self.async_set_unique_id(f"{self.init_info[ATTR_SERIAL_NUMBER]}")
                 # Abort the flow if a config entry with the same unique ID exists
-                self._abort_if_unique_id_configured(updates={CONF_PORT: user_input[CONF_PORT]})
+                self._abort_if_unique_id_configured(
+                    updates={CONF_PORT: user_input[CONF_PORT], ATTR_BAUDRATE: user_input[ATTR_BAUDRATE]}
+                )
                 self.init_info.update(user_input)
                 return self.async_create_entry(
                     title=DEFAULT_INTEGRATION_TITLE, data=self.init_info
                 )
 
-        # If no user input, must be first pass through the config.
-        data_schema = {
-            vol.Required(CONF_PORT, default=self._default_com_port): vol.In(
-                self._com_ports_list
-            ),
-        }
-
-        # Show initial form.
+        # Show initial form, or show it again after a validation error.
         return self.async_show_form(
-            step_id="init", data_schema=vol.Schema(data_schema), errors=errors
+            step_id="init", data_schema=self._port_schema(), errors=errors
         )
 
+    def _port_schema(self) -> vol.Schema:
+        """Return the port selection schema, built once per config flow."""
+        if self._port_schema_cached is None:
+            self._port_schema_cached = vol.Schema(
+                {
+                    vol.Required(CONF_PORT, default=self._default_com_port): vol.In(
+                        self._com_ports_list
+                    ),
+                    vol.Required(ATTR_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(
+                        BAUDRATES
+                    ),
+                }
+            )
+        return self._port_schema_cached
+
 
 class CannotOpenPort(HomeAssistantError):
     """Error to indicate we cannot connect."""
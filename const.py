@@ -1,5 +1,5 @@
 """Constants for the Renogy Rover integration."""
-from enum import Enum
+from datetime import timedelta
 
 DOMAIN = "renogy_rover"
 
@@ -8,8 +8,23 @@ DEFAULT_DEVICE_NAME = "Rover"
 
 MANUFACTURER = "Renogy"
 
+# Set a fairly high polling interval to get accurate power statistics
+FAST_UPDATE_INTERVAL = timedelta(seconds=3)
+# Daily statistics and the charging status change slowly
+SLOW_UPDATE_INTERVAL = timedelta(seconds=30)
+# Upper limit of the polling interval while the controller doesn't answer
+MAX_UPDATE_INTERVAL = timedelta(seconds=60)
+
 MIN_DEVICE_ADDRESS = 1
 MAX_DEVICE_ADDRESS = 247
 
+# Key in hass.data[DOMAIN] for the serial numbers validated by entry id
+DATA_LAST_PROBE = "_last_probe"
+
+# Baud rates supported by the controller, higher rates need shorter or better shielded cables
+BAUDRATES = (9600, 19200, 38400, 115200)
+DEFAULT_BAUDRATE = 9600
+
+ATTR_BAUDRATE = "baudrate"
 ATTR_DEVICE_ADDRESS = "device_address"
 ATTR_SERIAL_NUMBER = "serial_number"
\ No newline at end of file
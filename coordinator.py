@@ -0,0 +1,148 @@
+"""Data update coordinator for the Renogy Rover integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import logging
+import struct
+import time
+from typing import Any
+
+from serial import SerialException
+import minimalmodbus
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN, FAST_UPDATE_INTERVAL, MAX_UPDATE_INTERVAL, SLOW_UPDATE_INTERVAL
+from .renogy_rover import CHARGING_STATE, RenogyRover, decode_temperature, lookup_label
+
+_LOGGER = logging.getLogger(__name__)
+
+# Register blocks polled each cycle: first register, number of registers, byte layout and field names
+_Block = tuple[int, int, struct.Struct, tuple[str, ...]]
+
+# Registers 256 to 265: battery, temperatures, load and solar panel
+_FAST_BLOCKS: tuple[_Block, ...] = (
+    (
+        256,
+        10,
+        struct.Struct(">xBH2xBBHHHHHH"),
+        (
+            "battery_percentage",
+            "battery_voltage",
+            "controller_temperature",
+            "battery_temperature",
+            "load_voltage",
+            "load_current",
+            "load_power",
+            "solar_voltage",
+            "solar_current",
+            "solar_power",
+        ),
+    ),
+)
+
+# Registers 273 to 288: daily statistics and charging status
+_SLOW_BLOCKS: tuple[_Block, ...] = (
+    (
+        273,
+        16,
+        struct.Struct(">HHH24xxB"),
+        (
+            "charging_amp_hours_today",
+            "discharging_amp_hours_today",
+            "power_generation_today",
+            "charging_status",
+        ),
+    ),
+)
+
+# Conversion of raw values, fields without a decoder are used as they are
+_DECODERS: dict[str, Callable[[int], Any]] = {
+    "battery_voltage": lambda raw: raw / 10,
+    "controller_temperature": decode_temperature,
+    "battery_temperature": decode_temperature,
+    "load_voltage": lambda raw: raw / 10,
+    "load_current": lambda raw: raw / 100,
+    "solar_voltage": lambda raw: raw / 10,
+    "solar_current": lambda raw: raw / 100,
+    "charging_status": lambda raw: lookup_label(CHARGING_STATE, raw, "unknown"),
+}
+
+# Serial ports are shared by all clients on the same bus, so only one request may be in flight per port
+_PORT_LOCKS: dict[str, asyncio.Lock] = {}
+
+
+def port_lock(port: str) -> asyncio.Lock:
+    """Return the lock serialising access to the given serial port."""
+    if (lock := _PORT_LOCKS.get(port)) is None:
+        lock = _PORT_LOCKS[port] = asyncio.Lock()
+    return lock
+
+
+class RenogyRoverCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll a set of register blocks of a Renogy Rover with as few requests as possible."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: RenogyRover,
+        name: str,
+        update_interval: timedelta,
+        blocks: tuple[_Block, ...],
+    ) -> None:
+        """Initialise the coordinator."""
+        super().__init__(hass, _LOGGER, name=name, update_interval=update_interval)
+        self.client = client
+        self.lock = port_lock(client.serial.port)
+        self._default_update_interval = update_interval
+        self._blocks = blocks
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the latest values from the controller."""
+        try:
+            async with self.lock:
+                start = time.monotonic()
+                data = await self.hass.async_add_executor_job(self._read_all)
+                poll_latency = time.monotonic() - start
+        except (minimalmodbus.ModbusException, SerialException) as error:
+            # Back off while the controller doesn't answer, instead of keeping the bus busy with timeouts
+            self.update_interval = min(self.update_interval * 2, MAX_UPDATE_INTERVAL)
+            raise UpdateFailed(f"Error communicating with Rover: {error}") from error
+        self.update_interval = self._default_update_interval
+
+        if poll_latency > 0.5 * self._default_update_interval.total_seconds():
+            _LOGGER.warning("Polling %s took %.0f ms", self.name, poll_latency * 1000)
+        else:
+            _LOGGER.debug("Polling %s took %.0f ms", self.name, poll_latency * 1000)
+        data["poll_latency"] = round(poll_latency * 1000)
+        return data
+
+    def _read_all(self) -> dict[str, Any]:
+        """Read the register blocks and decode them."""
+        data: dict[str, Any] = {}
+        for register, count, layout, keys in self._blocks:
+            registers = self.client.read_registers(register, count)
+            raw_values = layout.unpack(struct.pack(f">{count}H", *registers))
+            for key, raw in zip(keys, raw_values):
+                decoder = _DECODERS.get(key)
+                data[key] = raw if decoder is None else decoder(raw)
+        return data
+
+
+class RenogyRoverFastCoordinator(RenogyRoverCoordinator):
+    """Poll the quickly changing battery, load and solar panel values."""
+
+    def __init__(self, hass: HomeAssistant, client: RenogyRover) -> None:
+        """Initialise the coordinator."""
+        super().__init__(hass, client, f"{DOMAIN}_fast", FAST_UPDATE_INTERVAL, _FAST_BLOCKS)
+
+
+class RenogyRoverSlowCoordinator(RenogyRoverCoordinator):
+    """Poll the slowly changing daily statistics and charging status."""
+
+    def __init__(self, hass: HomeAssistant, client: RenogyRover) -> None:
+        """Initialise the coordinator."""
+        super().__init__(hass, client, f"{DOMAIN}_slow", SLOW_UPDATE_INTERVAL, _SLOW_BLOCKS)
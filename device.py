@@ -15,40 +15,34 @@ from homeassistant.const import (
     ATTR_NAME,
     ATTR_SW_VERSION,
 )
-from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTR_SERIAL_NUMBER, DEFAULT_DEVICE_NAME, DOMAIN, MANUFACTURER
+from .coordinator import RenogyRoverCoordinator
 
 
-class RenogyRoverEntity(Entity):
+class RenogyRoverEntity(CoordinatorEntity[RenogyRoverCoordinator]):
     """Representation of a BMS device."""
 
     def __init__(
-        self, config_entry_data: Mapping[str, Any]
+        self,
+        coordinator: RenogyRoverCoordinator,
+        config_entry_data: Mapping[str, Any],
+        entity_description: EntityDescription,
     ) -> None:
         """Initialise the basic device."""
-        super().__init__()
-        self._config_entry_data = config_entry_data
-        self.type = "device"
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return the unique id for this device."""
-        serial = self._config_entry_data.get(ATTR_SERIAL_NUMBER)
-        if serial is None:
-            return None
-        return f"{serial}_{self.entity_description.key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device specific attributes."""
-        return {
-            ATTR_IDENTIFIERS: {(DOMAIN, self._config_entry_data[ATTR_SERIAL_NUMBER])},
-            ATTR_SERIAL_NUMBER: self._config_entry_data[ATTR_SERIAL_NUMBER],
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        # The config flow only creates entries with a serial number
+        self._attr_unique_id = f"{config_entry_data[ATTR_SERIAL_NUMBER]}_{entity_description.key}"
+        self._attr_device_info: DeviceInfo = {
+            ATTR_IDENTIFIERS: {(DOMAIN, config_entry_data[ATTR_SERIAL_NUMBER])},
+            ATTR_SERIAL_NUMBER: config_entry_data[ATTR_SERIAL_NUMBER],
             ATTR_MANUFACTURER: MANUFACTURER,
-            ATTR_MODEL: self._config_entry_data[ATTR_MODEL],
-            ATTR_MODEL_ID: self._config_entry_data[ATTR_MODEL],
-            ATTR_NAME: f"{MANUFACTURER} {DEFAULT_DEVICE_NAME} {self._config_entry_data[ATTR_MODEL]}",
-            ATTR_SW_VERSION: self._config_entry_data[ATTR_SW_VERSION],
-            ATTR_HW_VERSION: self._config_entry_data[ATTR_HW_VERSION],
+            ATTR_MODEL: config_entry_data[ATTR_MODEL],
+            ATTR_MODEL_ID: config_entry_data[ATTR_MODEL],
+            ATTR_NAME: f"{MANUFACTURER} {DEFAULT_DEVICE_NAME} {config_entry_data[ATTR_MODEL]}",
+            ATTR_SW_VERSION: config_entry_data[ATTR_SW_VERSION],
+            ATTR_HW_VERSION: config_entry_data[ATTR_HW_VERSION],
         }
@@ -6,19 +6,94 @@
 Driver for the Renogy Rover Solar Controller using the Modbus RTU protocol.
 """
 
+import functools
+import struct
+
 import minimalmodbus
 
-BATTERY_TYPE = {1: "open", 2: "sealed", 3: "gel", 4: "lithium", 5: "self-customized"}
+# Labels indexed by register value, index 0 of the battery types is unused
+BATTERY_TYPE = (None, "open", "sealed", "gel", "lithium", "self-customized")
+
+CHARGING_STATE = (
+    "deactivated",
+    "activated",
+    "mppt",
+    "equalizing",
+    "boost",
+    "floating",
+    "current limiting",
+)
+
+# Registers 20 to 23: unused byte and major version, minor and patch version, for software and hardware
+_VERSION_LAYOUT = struct.Struct(">xBBBxBBB")
+
+# Largest response read by this driver: address, function code, byte count, 16 registers and CRC
+MAX_RESPONSE_BYTES = 5 + 2 * 16
+# Response to the serial number request used to check for a device during an address scan
+SCAN_RESPONSE_BYTES = 5 + 2 * 2
+# Time the controller may take to start answering a request, in seconds. The protocol documentation
+# doesn't specify it, so this leaves room for a slow controller plus the USB-UART adaptor's latency.
+RESPONSE_MARGIN = 0.2
+
+
+def lookup_label(labels, code, default=None):
+    """
+    Return the label of a register value, or the default for unknown values.
+    """
+    return labels[code] if 0 <= code < len(labels) else default
+
+
+def _cached_forever(method):
+    """
+    Cache the result of a method that reads registers which never change at runtime.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self):
+        key = method.__name__
+        if key not in self._static_cache:
+            self._static_cache[key] = method(self)
+        return self._static_cache[key]
+
+    return wrapper
+
+
+# Temperatures by register byte, where the highest bit is the sign
+_TEMP_LUT = tuple(-(i - 128) if i & 0x80 else i for i in range(256))
+
+
+def decode_temperature(bits):
+    """
+    Decode a temperature byte, where the highest bit is the sign.
+    """
+    return _TEMP_LUT[bits & 0x00FF]
+
+
+def _decode_string(registers):
+    """
+    Decode a string stored as two characters per register.
+    """
+    return bytes(byte for register in registers for byte in (register >> 8, register & 0x00FF)).decode("latin1")
+
+
+def _decode_version(registers):
+    """
+    Decode the software and hardware version from registers 20 to 23.
+    """
+    soft_major, soft_minor, soft_patch, hard_major, hard_minor, hard_patch = _VERSION_LAYOUT.unpack(
+        struct.pack(">4H", *registers)
+    )
+    software_version = f"V{soft_major}.{soft_minor}.{soft_patch}"
+    hardware_version = f"V{hard_major}.{hard_minor}.{hard_patch}"
+    return (software_version, hardware_version)
 
-CHARGING_STATE = {
-    0: "deactivated",
-    1: "activated",
-    2: "mppt",
-    3: "equalizing",
-    4: "boost",
-    5: "floating",
-    6: "current limiting",
-}
+
+def _decode_serial_number(registers):
+    """
+    Decode the serial number from registers 24 and 25.
+    The decimal concatenation is kept as is, because existing config entries and entities are identified by it.
+    """
+    return f"{registers[0]}{registers[1]}"
 
 
 class RenogyRover(minimalmodbus.Instrument):
@@ -26,17 +101,83 @@ class RenogyRover(minimalmodbus.Instrument):
     Communicates using the Modbus RTU protocol (via provided USB<->RS232 cable).
     """
 
-    def __init__(self, portname, slaveaddress, baudrate=9600, timeout=0.5):
+    def __init__(self, portname, slaveaddress, baudrate=9600, timeout=None, scan_timeout=None):
         minimalmodbus.Instrument.__init__(self, portname, slaveaddress)
-        self.serial.baudrate = baudrate
-        self.serial.timeout = timeout
+        self._static_cache = {}
+        # Discard stray bytes of an aborted transaction before each request, so they can't corrupt the next response.
+        # minimalmodbus also waits the 3.5 character silent interval since the last response before sending.
+        self.clear_buffers_before_each_transaction = True
+        self.baudrate = baudrate
+        if timeout is None:
+            timeout = self.response_timeout(baudrate)
+        self.timeout = timeout
+        self._read_timeout = timeout if scan_timeout is None else scan_timeout
+        self._enable_low_latency()
+
+    def _communicate(self, request, number_of_bytes_to_read):
+        """
+        Apply this client's baud rate and read timeout before each transaction.
+        minimalmodbus shares one serial port object between all clients of a port,
+        so a setting made on it by one client would otherwise leak into the others.
+        """
+        if self.serial.baudrate != self.baudrate:
+            self.serial.baudrate = self.baudrate
+        if self.serial.timeout != self._read_timeout:
+            self.serial.timeout = self._read_timeout
+        return minimalmodbus.Instrument._communicate(self, request, number_of_bytes_to_read)
+
+    @staticmethod
+    def response_timeout(baudrate, response_bytes=MAX_RESPONSE_BYTES, response_margin=RESPONSE_MARGIN):
+        """
+        Calculate the read timeout from the time the response takes on the wire
+        (11 bits per byte with start, parity and stop bits) plus the controller's response time.
+        Defaults to the longest response read by this driver.
+        """
+        return max(0.05, response_bytes * 11.0 / baudrate + response_margin)
+
+    def _enable_low_latency(self):
+        """
+        Enable the low latency mode of the serial port if supported (Linux only).
+        Without it USB-UART adaptors like FTDI buffer incoming bytes for up to 16 ms.
+        """
+        if not hasattr(self.serial, "set_low_latency_mode"):
+            return
+        try:
+            self.serial.set_low_latency_mode(True)
+        except (ValueError, NotImplementedError):
+            # Not supported by the serial driver (ValueError) or the platform, e.g. macOS and BSD (NotImplementedError)
+            pass
+
+    def restore_timeout(self):
+        """
+        Switch from the scan timeout back to the regular read timeout.
+        """
+        self._read_timeout = self.timeout
 
+    @_cached_forever
     def model(self):
         """
         Read the controller's model information.
         """
         return self.read_string(12, number_of_registers=8)
 
+    @_cached_forever
+    def device_info_block(self):
+        """
+        Read model, versions and serial number with a single request.
+        Returns a tuple of (model, software version, hardware version, serial number).
+        """
+        registers = self.read_registers(12, 14)
+        model = _decode_string(registers[0:8])
+        software_version, hardware_version = _decode_version(registers[8:12])
+        serial_number = _decode_serial_number(registers[12:14])
+        self._static_cache.update(
+            model=model,
+            version=(software_version, hardware_version),
+            serial_number=serial_number,
+        )
+        return (model, software_version, hardware_version, serial_number)
+
     def system_voltage_current(self):
         """
         Read the controler's system voltage and current.
@@ -47,28 +188,20 @@ class RenogyRover(minimalmodbus.Instrument):
         voltage = register >> 8
         return (voltage, amps)
 
+    @_cached_forever
     def version(self):
         """
         Read the controler's software and hardware version information.
         Returns a tuple of (software version, hardware version).
         """
-        registers = self.read_registers(20, 4)
-        soft_major = registers[0] & 0x00FF
-        soft_minor = registers[1] >> 8
-        soft_patch = registers[1] & 0x00FF
-        hard_major = registers[2] & 0x00FF
-        hard_minor = registers[3] >> 8
-        hard_patch = registers[3] & 0x00FF
-        software_version = f"V{soft_major}.{soft_minor}.{soft_patch}"
-        hardware_version = f"V{hard_major}.{hard_minor}.{hard_patch}"
-        return (software_version, hardware_version)
+        return _decode_version(self.read_registers(20, 4))
 
+    @_cached_forever
     def serial_number(self):
         """
         Read the controller's serial number.
         """
-        registers = self.read_registers(24, 2)
-        return f"{registers[0]}{registers[1]}"
+        return _decode_serial_number(self.read_registers(24, 2))
 
     def battery_percentage(self):
         """
@@ -82,27 +215,25 @@ class RenogyRover(minimalmodbus.Instrument):
         """
         return self.read_register(257, number_of_decimals=1)
 
+    def temperatures(self):
+        """
+        Read the battery surface and controller temperatures, which share one register.
+        Returns a tuple of (battery temperature, controller temperature).
+        """
+        register = self.read_register(259)
+        return (_TEMP_LUT[register & 0x00FF], _TEMP_LUT[(register >> 8) & 0x00FF])
+
     def battery_temperature(self):
         """
         Read the battery surface temperature.
         """
-        register = self.read_register(259)
-        battery_temp_bits = register & 0x00FF
-        temp_value = battery_temp_bits & 0x0FF
-        sign = battery_temp_bits >> 7
-        battery_temp = -(temp_value - 128) if sign == 1 else temp_value
-        return battery_temp
+        return self.temperatures()[0]
 
     def controller_temperature(self):
         """
         Read the controller temperature.
         """
-        register = self.read_register(259)
-        controller_temp_bits = register >> 8
-        temp_value = controller_temp_bits & 0x0FF
-        sign = controller_temp_bits >> 7
-        controller_temp = -(temp_value - 128) if sign == 1 else temp_value
-        return controller_temp
+        return self.temperatures()[1]
 
     def load_voltage(self):
         """
@@ -162,12 +293,14 @@ class RenogyRover(minimalmodbus.Instrument):
 
     def charging_status_label(self):
         """Read charging status label."""
-        return CHARGING_STATE.get(self.charging_status())
+        return lookup_label(CHARGING_STATE, self.charging_status())
 
+    @_cached_forever
     def battery_capacity(self):
         """Read battery capacity."""
         return self.read_register(57346)
 
+    @_cached_forever
     def voltage_setting(self):
         """Read voltage setting."""
         register = self.read_register(57347)
@@ -175,10 +308,11 @@ class RenogyRover(minimalmodbus.Instrument):
         recognized_voltage = register & 0x00FF
         return (setting, recognized_voltage)
 
+    @_cached_forever
     def battery_type(self):
         """Read battery type."""
         register = self.read_register(57348)
-        return BATTERY_TYPE.get(register)
+        return lookup_label(BATTERY_TYPE, register)
 
     # TODO: resume at 3.10 of spec
 
@@ -192,9 +326,8 @@ if __name__ == "__main__":
     print("Battery Type: ", rover.battery_type())
     print("Battery Capacity: ", rover.battery_capacity())
     print("Battery Voltage: ", rover.battery_voltage())
-    _battery_temp = rover.battery_temperature()
+    _battery_temp, _controller_temp = rover.temperatures()
     print("Battery Temperature: ", _battery_temp, _battery_temp * 1.8 + 32)
-    _controller_temp = rover.controller_temperature()
     print("Controller Temperature: ", _controller_temp, _controller_temp * 1.8 + 32)
     print("Load Voltage: ", rover.load_voltage())
     print("Load Current: ", rover.load_current())
@@ -1,6 +1,6 @@
-from collections.abc import Mapping
-from datetime import timedelta
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -18,16 +18,96 @@ from homeassistant.const import (
     UnitOfEnergy,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
 )
 
 from .const import DOMAIN
+from .coordinator import RenogyRoverCoordinator
 from .device import RenogyRoverEntity
-from .renogy_rover import RenogyRover
 
-# Disable parallel updates
-PARALLEL_UPDATES = 1
-# Set a fairly high polling interval to get accurate power statistics
-SCAN_INTERVAL = timedelta(seconds=3)
+# Updates are driven by the coordinators, which serialise access to the serial port
+PARALLEL_UPDATES = 0
+
+
+@dataclass(frozen=True, kw_only=True)
+class RenogyRoverSensorEntityDescription(SensorEntityDescription):
+    """Describes a Renogy Rover sensor."""
+
+    value_fn: Callable[[dict[str, Any]], Any]
+    # Coordinator polling the value, see RenogyRoverFastCoordinator and RenogyRoverSlowCoordinator
+    coordinator: Literal["fast", "slow"] = "fast"
+
+
+SENSOR_DESCRIPTIONS: tuple[RenogyRoverSensorEntityDescription, ...] = (
+    RenogyRoverSensorEntityDescription(
+        key="solar_voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Solar Voltage",
+        value_fn=lambda data: data["solar_voltage"],
+    ),
+    RenogyRoverSensorEntityDescription(
+        key="solar_current",
+        device_class=SensorDeviceClass.CURRENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Solar Current",
+        value_fn=lambda data: data["solar_current"],
+    ),
+    RenogyRoverSensorEntityDescription(
+        key="solar_power",
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Solar Power",
+        value_fn=lambda data: data["solar_power"],
+    ),
+    RenogyRoverSensorEntityDescription(
+        key="battery_voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Battery Voltage",
+        value_fn=lambda data: data["battery_voltage"],
+    ),
+    RenogyRoverSensorEntityDescription(
+        key="energy_production_today",
+        device_class=SensorDeviceClass.ENERGY,
+        native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        name="Energy Production Today",
+        value_fn=lambda data: data["power_generation_today"],
+        coordinator="slow",
+    ),
+    RenogyRoverSensorEntityDescription(
+        key="controller_temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Controller Temperature",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["controller_temperature"],
+    ),
+    RenogyRoverSensorEntityDescription(
+        key="charging_status",
+        name="Charging Status",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda data: data["charging_status"],
+        coordinator="slow",
+    ),
+    RenogyRoverSensorEntityDescription(
+        key="poll_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        name="Poll Latency",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda data: data["poll_latency"],
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,149 +115,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Renogy Rover sensor based on a config entry."""
-    entities: list[SensorEntity] = []
-
-    client: RenogyRover = hass.data[DOMAIN][config_entry.entry_id]
-    config_entry_data = config_entry.data
-
-    entities.append(SolarVoltageSensor(client, config_entry_data))
-    entities.append(SolarCurrentSensor(client, config_entry_data))
-    entities.append(SolarPowerSensor(client, config_entry_data))
-    entities.append(BatteryVoltageSensor(client, config_entry_data))
-    entities.append(EnergyProductionTodaySensor(client, config_entry_data))
-    entities.append(ControllerTemperatureSensor(client, config_entry_data))
-    entities.append(ChargingStatusSensor(client, config_entry_data))
-
-    async_add_entities(entities, True)
+    coordinators: dict[str, RenogyRoverCoordinator] = hass.data[DOMAIN][config_entry.entry_id]
 
-class SolarVoltageSensor(RenogyRoverEntity, SensorEntity):
-
-    def __init__(self, client: RenogyRover, config_entry_data: Mapping[str, Any]):
-        super().__init__(config_entry_data)
-        self.client = client
-        self.entity_description = SensorEntityDescription(
-            key="solar_voltage",
-            device_class=SensorDeviceClass.VOLTAGE,
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            state_class=SensorStateClass.MEASUREMENT,
-            name="Solar Voltage",
-        )
-
-    def update(self) -> None:
-        """
-        Fetch new state data for the sensor.
-        """
-        self._attr_native_value = self.client.solar_voltage()
+    async_add_entities(
+        RenogyRoverSensor(coordinators[description.coordinator], config_entry.data, description)
+        for description in SENSOR_DESCRIPTIONS
+    )
 
-class SolarCurrentSensor(RenogyRoverEntity, SensorEntity):
-
-    def __init__(self, client: RenogyRover, config_entry_data: Mapping[str, Any]):
-        super().__init__(config_entry_data)
-        self.client = client
-        self.entity_description = SensorEntityDescription(
-            key="solar_current",
-            device_class=SensorDeviceClass.CURRENT,
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            state_class=SensorStateClass.MEASUREMENT,
-            name="Solar Current",
-        )
-
-    def update(self) -> None:
-        """
-        Fetch new state data for the sensor.
-        """
-        self._attr_native_value = self.client.solar_current()
-
-class SolarPowerSensor(RenogyRoverEntity, SensorEntity):
-
-    def __init__(self, client: RenogyRover, config_entry_data: Mapping[str, Any]):
-        super().__init__(config_entry_data)
-        self.client = client
-        self.entity_description = SensorEntityDescription(
-            key="solar_power",
-            device_class=SensorDeviceClass.POWER,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            state_class=SensorStateClass.MEASUREMENT,
-            name="Solar Power",
-        )
-
-    def update(self) -> None:
-        """
-        Fetch new state data for the sensor.
-        """
-        self._attr_native_value = self.client.solar_power()
-
-class BatteryVoltageSensor(RenogyRoverEntity, SensorEntity):
-
-    def __init__(self, client: RenogyRover, config_entry_data: Mapping[str, Any]):
-        super().__init__(config_entry_data)
-        self.client = client
-        self.entity_description = SensorEntityDescription(
-            key="battery_voltage",
-            device_class=SensorDeviceClass.VOLTAGE,
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            state_class=SensorStateClass.MEASUREMENT,
-            name="Battery Voltage",
-        )
-
-    def update(self) -> None:
-        """
-        Fetch new state data for the sensor.
-        """
-        self._attr_native_value = self.client.battery_voltage()
-
-class EnergyProductionTodaySensor(RenogyRoverEntity, SensorEntity):
-
-    def __init__(self, client: RenogyRover, config_entry_data: Mapping[str, Any]):
-        super().__init__(config_entry_data)
-        self.client = client
-        self.entity_description = SensorEntityDescription(
-            key="energy_production_today",
-            device_class=SensorDeviceClass.ENERGY,
-            native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
-            state_class=SensorStateClass.TOTAL_INCREASING,
-            name="Energy Production Today",
-        )
-
-    def update(self) -> None:
-        """
-        Fetch new state data for the sensor.
-        """
-        self._attr_native_value = self.client.power_generation_today()
-
-class ControllerTemperatureSensor(RenogyRoverEntity, SensorEntity):
-
-    def __init__(self, client: RenogyRover, config_entry_data: Mapping[str, Any]):
-        super().__init__(config_entry_data)
-        self.client = client
-        self.entity_description = SensorEntityDescription(
-            key="controller_temperature",
-            device_class=SensorDeviceClass.TEMPERATURE,
-            native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-            state_class=SensorStateClass.MEASUREMENT,
-            name="Controller Temperature",
-            entity_category=EntityCategory.DIAGNOSTIC
-        )
-
-    def update(self) -> None:
-        """
-        Fetch new state data for the sensor.
-        """
-        self._attr_native_value = self.client.controller_temperature()
 
-class ChargingStatusSensor(RenogyRoverEntity, SensorEntity):
+class RenogyRoverSensor(RenogyRoverEntity, SensorEntity):
+    """Sensor for one value polled by the coordinator."""
 
-    def __init__(self, client: RenogyRover, config_entry_data: Mapping[str, Any]):
-        super().__init__(config_entry_data)
-        self.client = client
-        self.entity_description = SensorEntityDescription(
-            key="charging_status",
-            name="Charging Status",
-            entity_category=EntityCategory.DIAGNOSTIC
-        )
+    entity_description: RenogyRoverSensorEntityDescription
 
-    def update(self) -> None:
+    @property
+    def native_value(self):
         """
-        Fetch new state data for the sensor.
+        Return the latest value polled by the coordinator.
         """
-        self._attr_native_value = self.client.charging_status_label()
+        return self.entity_description.value_fn(self.coordinator.data)